@@ -32,60 +32,58 @@ class GridLayout(QtWidgets.QGridLayout):
         self.setRowStretch(9999, 1)
         self.setColumnStretch(9999, 1)
 
+        # -----Occupancy caches, updated in _add_item-----
+        # The Qt layout remains the source of truth for rendering; these only
+        # exist so the query methods below are O(1) instead of rescanning
+        # every item with getItemPosition. Each row maps to a bitmask of its
+        # occupied columns (bit n set = column n filled).
+        self._last_row: int = -1
+        self._row_cols: dict[int, int] = {}
+
     # -----Query Methods-------------------------------------------------------
 
     def get_last_filled_row(self) -> int:
         """Return the last row index containing any items.
 
-        Iterates over all layout items to determine the highest row index in
-        use.
-
         Returns:
             int: The highest occupied row index, or -1 if the layout is empty.
         """
-        if self.count() == 0:
-            return -1
-
-        last_row: int = -1
-
-        for i in range(self.count()):
-            row, _col, row_span, _col_span = self.getItemPosition(i)
-            bottom_row = row + (row_span - 1 if row_span > 0 else 0)
-            if bottom_row > last_row:
-                last_row = bottom_row
-
-        return last_row
+        return self._last_row
 
     def get_next_column(self, row: int) -> int:
         """Return the next empty column index in the given row.
 
-        This inspects all items occupying the specified row and determines the
-        first available (unused) column index.
-
         Args:
             row: The row number to search within.
 
         Returns:
             The first unoccupied column index in the given row.
         """
-        occupied: set[int] = set()
-        for i in range(self.count()):
-            item_row, item_col, row_span, col_span = self.getItemPosition(i)
-            if item_row <= row < item_row + row_span:
-                occupied.update(range(item_col, item_col + col_span))
-        for expected in range(max(occupied, default=-1) + 2):
-            if expected not in occupied:
-                return expected
-        return 0
+        mask = self._row_cols.get(row, 0)
+        # First zero bit of the mask is the first free column.
+        inv = ~mask & ((1 << 64) - 1)
+        return (inv & -inv).bit_length() - 1
 
     # -----Insertion Methods---------------------------------------------------
 
     def _add_item(self, item: QItem, row: int, col: int) -> None:
+        self._row_cols[row] = self._row_cols.get(row, 0) | (1 << col)
+        if row > self._last_row:
+            self._last_row = row
+
         if isinstance(item, QtWidgets.QWidget):
             self.addWidget(item, row, col, ALIGN_TOP_LEFT)
         elif isinstance(item, QtWidgets.QLayout):
             self.addLayout(item, row, col, ALIGN_TOP_LEFT)
 
+    def add_item(self, item: QItem, row: int, col: int) -> None:
+        """Adds the QtWidget or QLayout item at an explicit row and column.
+
+        For callers that already track their own cursor; skips the occupancy
+        queries entirely.
+        """
+        self._add_item(item, row, col)
+
     def add_to_next_row(self, item: QItem) -> None:
         """Adds the QtWidget or QLayout item to the first column of the next
         row.
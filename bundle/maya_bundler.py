@@ -55,12 +55,22 @@ class UndoChunk:
         cmds.undoInfo(closeChunk=True)
 
 
+_MAIN_WIN: Optional[QtWidgets.QMainWindow] = None
+
+
 def get_main_window() -> QtWidgets.QMainWindow:
-    """Get the Maya main window as a QMainWindow instance."""
-    win = shiboken6.wrapInstance(
-        int(omui.MQtUtil.mainWindow()), QtWidgets.QMainWindow
-    )
-    return cast(QtWidgets.QMainWindow, win)
+    """Get the Maya main window as a QMainWindow instance.
+
+    The wrapped instance is cached; the Maya main window never changes
+    within a session, so the C++ crossing only happens once.
+    """
+    global _MAIN_WIN
+    if _MAIN_WIN is None:
+        win = shiboken6.wrapInstance(
+            int(omui.MQtUtil.mainWindow()), QtWidgets.QMainWindow
+        )
+        _MAIN_WIN = cast(QtWidgets.QMainWindow, win)
+    return _MAIN_WIN
 
 
 # -----Action Functions--------------------------------------------------------
@@ -77,9 +87,15 @@ def script_action(items: list[str]) -> None:
 
 
 def file_action(items: list[str]) -> None:
-    t = Path(items[0])
-    folder = t.parent if t.is_file() else t.parent
-    subprocess.run(['explorer', folder.as_posix()])
+    # Ordered dedupe: one explorer window per unique parent folder, in drop
+    # order.
+    seen: set[str] = set()
+    for item in items:
+        folder = Path(item).parent.as_posix()
+        if folder in seen:
+            continue
+        seen.add(folder)
+        subprocess.run(['explorer', folder])
 
 
 # -----Maya Wrapper------------------------------------------------------------
@@ -87,30 +103,26 @@ def file_action(items: list[str]) -> None:
 
 def button_factory(s: str) -> Optional[bundle.window.BundleButton]:
     """Generates a button given the dragged and dropped text s."""
-    text_kind = bundle.text_kind.classify_text(s)
+    text_kind, lines = bundle.text_kind.classify_text(s)
 
     icon = None
-    entries = None
     action = None
 
     if text_kind == bundle.text_kind.TextKind.FILE_PATHS:
         icon = icons['folder']
-        entries = s.split('\n')
         action = file_action
     if text_kind == bundle.text_kind.TextKind.PYTHON_SCRIPT:
         icon = icons['python']
-        entries = [s]
         action = script_action
     if text_kind == bundle.text_kind.TextKind.MAYA_DAG_PATHS:
         icon = icons['object']
-        entries = s.split('\n')
         action = dag_action
 
-    if icon is None and entries is None and action is None:
+    if icon is None and action is None:
         return None
 
     button = bundle.window.BundleButton(
-        entries=entries,
+        entries=lines,
         icon=icon,
         action=action
     )
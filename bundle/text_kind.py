@@ -9,12 +9,14 @@ or Python source code.
 
 import ast
 import enum
+import functools
 import re
-from pathlib import Path
 
 
 _MAYA_SEGMENT_RX = r'[A-Za-z0-9_][A-Za-z0-9_:]*'
-_MAYA_PATH_RX = re.compile(rf'^\|?({_MAYA_SEGMENT_RX})(?:\|{_MAYA_SEGMENT_RX})*$')
+_MAYA_PATH_RX: re.Pattern[str] = re.compile(
+    rf'\|?({_MAYA_SEGMENT_RX})(?:\|{_MAYA_SEGMENT_RX})*'
+)
 _WINDOWS_DRIVE_RX: re.Pattern[str] = re.compile(r'^[A-Za-z]:[\\/]')
 _UNC_RX: re.Pattern[str] = re.compile(r'^(?:\\\\|//)[^\\/\s]+[\\/]?')
 
@@ -51,11 +53,7 @@ def _looks_like_posix_path(line: str) -> bool:
     Returns:
         bool: Does path resemble posix path?
     """
-    if line.startswith('/'):
-        return True
-    if line.startswith('./') or line.startswith('../'):
-        return True
-    return False
+    return line.startswith(('/', './', '../'))
 
 
 def _looks_like_unc_path(line: str) -> bool:
@@ -74,49 +72,47 @@ def looks_like_file_path(line: str) -> bool:
         line (str): The text to validate.
 
     Returns:
-        bool: True if the line resembles a Windows drive, UNC, or POSIX path,
-        or normalizes to a plausible path via pathlib (excluding bare filenames).
+        bool: True if the line resembles a Windows drive, UNC, or POSIX path.
     """
+    # Cheapest checks first: separator presence, then prefix tests, then the
+    # compiled regexes.
     if not _has_pathlike_separators(line):
         return False
 
+    if _looks_like_posix_path(line):
+        return True
     if _looks_like_windows_drive_path(line):
         return True
     if _looks_like_unc_path(line):
         return True
-    if _looks_like_posix_path(line):
-        return True
-
-    # Fallback: if it normalizes to something non-trivial with pathlib, treat
-    # as path
-    try:
-        p = Path(line)
-        # Reject pure filename with no separators to avoid false positives
-        if p.name != line and len(str(p)) > 1:
-            return True
-    except (OSError, RuntimeError, ValueError):
-        pass
 
     return False
 
 
+# Don't bother parsing payloads above this size; real scripts dropped onto
+# the window are far smaller, huge blobs are invariably path lists.
+_MAX_SCRIPT_LEN = 100_000
+
+
 def looks_like_python_script(text: str) -> bool:
     """True if the text parses cleanly as Python (non-empty)."""
     # Avoid parsing a long list of paths as code: require at least one newline
     # or a semicolon/colon/def/class/import to hint code-ish content.
     trimmed = text.strip()
-    if not trimmed:
+    if not trimmed or len(trimmed) > _MAX_SCRIPT_LEN:
         return False
 
     tokens = (
         '\n', ';', ':', 'def ', 'class ',
         'import ', 'from ', 'with ', 'for ', 'if '
     )
-    code_hint = any(tok in trimmed for tok in tokens)
+    if not any(tok in trimmed for tok in tokens):
+        return False
 
     try:
-        ast.parse(trimmed)
-        return code_hint or '\n' in trimmed or len(trimmed.split()) > 3
+        # Same effect as ast.parse without its Python-layer indirection.
+        compile(trimmed, '<drop>', 'exec', flags=ast.PyCF_ONLY_AST)
+        return True
     except SyntaxError:
         return False
 
@@ -143,28 +139,46 @@ def looks_like_maya_dag_path(line: str) -> bool:
     if ' ' in line or '\t' in line:
         return False
 
-    return _MAYA_PATH_RX.match(line) is not None
+    return _MAYA_PATH_RX.fullmatch(line) is not None
 
 
-def classify_text(text: str) -> TextKind:
+@functools.lru_cache(maxsize=256)
+def _classify_text(text: str) -> tuple[TextKind, tuple[str, ...]]:
+    """Cached worker for classify_text; lines are a tuple so cached values
+    stay immutable.
+    """
+    lines = split_nonempty_lines(text)
+    if not lines:
+        return TextKind.UNKNOWN, ()
+
+    # Cheap first-line heuristics cover the dominant drop payloads (file
+    # paths, DAG paths) without ever touching the AST parser.
+    if looks_like_file_path(lines[0]):
+        return TextKind.FILE_PATHS, tuple(lines)
+    if looks_like_maya_dag_path(lines[0]):
+        return TextKind.MAYA_DAG_PATHS, tuple(lines)
+
+    if looks_like_python_script(text):
+        return TextKind.PYTHON_SCRIPT, (text,)
+
+    return TextKind.UNKNOWN, tuple(lines)
+
+
+def classify_text(text: str) -> tuple[TextKind, list[str]]:
     """
     Classifies the given text string based on what kind of pattern it matches.
     Assumes all lines are of the same type.
 
+    Classification is pure, so results are memoized; re-dropping an identical
+    payload skips the regex and parse work entirely.
+
     Args:
         text (str): The text to classify.
     Returns:
-        TextKind: The text kind enum entry.
-         Returns TextKind.UNKNOWN if text could not be classified.
+        tuple[TextKind, list[str]]: The text kind enum entry and the split,
+         stripped lines the classification was based on (the whole text as a
+         single entry for TextKind.PYTHON_SCRIPT). The kind is
+         TextKind.UNKNOWN if text could not be classified.
     """
-    if looks_like_python_script(text):
-        return TextKind.PYTHON_SCRIPT
-
-    lines = split_nonempty_lines(text)
-
-    if looks_like_file_path(lines[0]):
-        return TextKind.FILE_PATHS
-    if looks_like_maya_dag_path(lines[0]):
-        return TextKind.MAYA_DAG_PATHS
-
-    return TextKind.UNKNOWN
+    kind, lines = _classify_text(text)
+    return kind, list(lines)
@@ -8,13 +8,23 @@ The primary bundle PySide window.
 from pathlib import Path
 from typing import Callable
 
+from PySide6 import QtCore
 from PySide6 import QtGui
 from PySide6 import QtWidgets
 
 from bundle.grid_layout import GridLayout
 
 
-class BundleButton(QtWidgets.QWidget):
+# Icons are decoded from disk once and shared between buttons; the window
+# only ever uses a handful of distinct icon files.
+_ICON_CACHE: dict[str, QtGui.QIcon] = {}
+
+# Tooltips only show this many entries; enough to identify the bundle
+# without joining hundreds of paths into one string.
+_TOOLTIP_MAX_ENTRIES = 20
+
+
+class BundleButton(QtWidgets.QPushButton):
     """
     A bundle button, used to store items and a selection function within the
     bundle menu.
@@ -28,24 +38,34 @@ class BundleButton(QtWidgets.QWidget):
     ) -> None:
         super().__init__()
 
-        self.setToolTip('\n'.join(entries))
         self.setFixedSize(40, 40)
 
         self.icon_path = icon
         self.action = action
         self.entries = entries
 
-        self.layout_main = QtWidgets.QVBoxLayout()
-        self.setLayout(self.layout_main)
-
-        self.button = QtWidgets.QPushButton()
-        self.layout_main.addWidget(self.button)
         self.set_icon(icon)
-        self.button.clicked.connect(self.button_connection)
+        self.clicked.connect(self.button_connection)
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        # Build the tooltip lazily on hover rather than joining every entry
+        # into a string at construction time.
+        if event.type() == QtCore.QEvent.Type.ToolTip:
+            QtWidgets.QToolTip.showText(
+                event.globalPos(),
+                '\n'.join(self.entries[:_TOOLTIP_MAX_ENTRIES]),
+                self
+            )
+            return True
+        return super().event(event)
 
     def set_icon(self, icon_path: Path) -> None:
-        pixmap: QtGui.QPixmap = QtGui.QPixmap(icon_path.as_posix())
-        self.button.setIcon(QtGui.QIcon(pixmap))
+        key = icon_path.as_posix()
+        icon = _ICON_CACHE.get(key)
+        if icon is None:
+            icon = QtGui.QIcon(QtGui.QPixmap(key))
+            _ICON_CACHE[key] = icon
+        self.setIcon(icon)
 
     def button_connection(self) -> None:
         self.action(self.entries)
@@ -73,6 +93,7 @@ class BundleWindow(QtWidgets.QMainWindow):
         self.button_factory = button_factory
 
         self._max_col = 10
+        self._cur_row = 0
         self._cur_col = 0
 
         w = (self._max_col * 40) + (4 * self._max_col)
@@ -103,15 +124,22 @@ class BundleWindow(QtWidgets.QMainWindow):
             return
 
         text = event.mimeData().text()
-        button = self.button_factory(text)
-        if button is None:
-            return
 
-        if self._cur_col >= self._max_col:
-            self._cur_col = 0
-            self.layout_main.add_to_next_row(button)
-        else:
-            self.layout_main.add_to_next_column(button)
+        # Suspend repaints while the button is built and placed so the grid
+        # recomputes geometry once instead of per addWidget.
+        self.setUpdatesEnabled(False)
+        try:
+            button = self.button_factory(text)
+            if button is None:
+                return
+
+            if self._cur_col >= self._max_col:
+                self._cur_col = 0
+                self._cur_row += 1
+            self.layout_main.add_item(button, self._cur_row, self._cur_col)
             self._cur_col += 1
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
         event.acceptProposedAction()